@@ -15,14 +15,18 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import maya
 from constant_sorrow.constants import UNKNOWN_DEVELOPMENT_CHAIN_ID
 from decimal import Decimal
 from eth_utils import is_address, is_hex, to_checksum_address
-from typing import Union
-from web3 import Web3
+from typing import Callable, Iterable, List, Union
+from web3 import HTTPProvider, Web3
 from web3.contract import ContractConstructor, ContractFunction
 
+from nucypher.config.constants import MAX_CONCURRENT_STAKER_READS
+
 
 def epoch_to_period(epoch: int, seconds_per_period: int) -> int:
     period = epoch // seconds_per_period
@@ -127,3 +131,18 @@ def get_transaction_name(contract_function: Union[ContractFunction, ContractCons
     except AttributeError:
         transaction_name = 'DEPLOY' if deployment else 'UNKNOWN'
     return transaction_name
+
+
+def read_concurrently(fn: Callable, items: Iterable, blockchain) -> List:
+    """
+    Maps `fn` over `items`, returning the results in the same order as `items`.
+
+    Over an HTTP provider the calls are made from a thread pool, so that their RPC round-trips overlap.
+    Any other provider is read one call at a time: a websocket provider serves every request over a single
+    connection which cannot wait on overlapping responses, and an IPC provider serializes requests anyway.
+    """
+    if not isinstance(blockchain.provider, HTTPProvider):
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STAKER_READS) as executor:
+        results = list(executor.map(fn, items))
+    return results
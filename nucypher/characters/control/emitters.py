@@ -72,6 +72,13 @@ class StdoutEmitter:
         if verbosity <= self.verbosity:
             click.secho(message=message, fg=color or self.default_color, bold=bold, nl=nl)
 
+    def style(self,
+              message: str,
+              color: str = None,
+              bold: bool = False) -> str:
+        """Styles a message as `echo` would paint it, so that differently styled text can be painted in one echo."""
+        return click.style(message, fg=color or self.default_color, bold=bold)
+
     def banner(self, banner):
         if self.verbosity >= 1:
             click.echo(banner)
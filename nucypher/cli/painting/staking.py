@@ -16,19 +16,80 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+from decimal import Decimal
+from typing import NamedTuple, TYPE_CHECKING
+
 import tabulate
-from web3.main import Web3
+from web3.types import Wei
 
 from nucypher.blockchain.eth.constants import STAKING_ESCROW_CONTRACT_NAME
 from nucypher.blockchain.eth.token import NU
-from nucypher.blockchain.eth.utils import datetime_at_period, prettify_eth_amount
+from nucypher.blockchain.eth.utils import datetime_at_period, prettify_eth_amount, read_concurrently
 from nucypher.characters.control.emitters import StdoutEmitter
 from nucypher.cli.literature import POST_STAKING_ADVICE
 from nucypher.cli.painting.transactions import paint_receipt_summary
+from nucypher.types import Period
+
+if TYPE_CHECKING:
+    from nucypher.blockchain.eth.actors import Staker  # Avoid circular import
 
 STAKE_TABLE_COLUMNS = ('Idx', 'Value', 'Remaining', 'Enactment', 'Termination')
 STAKER_TABLE_COLUMNS = ('Status', 'Restaking', 'Winding Down', 'Unclaimed Fees', 'Min fee rate')
 
+_ETHER = Decimal(10) ** 18  # wei per ether
+
+_PRETTY_DATETIME_FORMAT = "%b %d %H:%M %Z"
+
+_SEP73 = '═' * 73
+_SEP30 = '═' * 30
+_SEP28 = '═' * 28
+
+# Widest label of the per-staker summary table
+_STAKER_TABLE_LABEL_WIDTH = max(len(column) for column in STAKER_TABLE_COLUMNS)
+
+
+def _format_staker_table(staker_data: list) -> str:
+    """Renders the per-staker summary as an unboxed two-column table, with a dashed rule above and below."""
+    value_width = max(len(value) for value in staker_data)
+    rule = f"{'-' * _STAKER_TABLE_LABEL_WIDTH}  {'-' * value_width}"
+    lines = [rule]
+    lines.extend(f"{column.ljust(_STAKER_TABLE_LABEL_WIDTH)}  {value}"
+                 for column, value in zip(STAKER_TABLE_COLUMNS, staker_data))
+    lines.append(rule)
+    return '\n'.join(lines)
+
+
+def _missing_commitments_info(missing: int, last_committed: int) -> str:
+    if missing == -1:
+        return "Never Made a Commitment (New Stake)"
+    if missing == 0:
+        return f"Committed #{last_committed}"
+    return f"Missing {missing} commitment{'s' if missing > 1 else ''}"
+
+
+class _StakerSummary(NamedTuple):
+    fees: Wei
+    last_committed_period: Period
+    missing_commitments: int
+    min_fee_rate: Wei
+    is_restaking: bool
+    restaking_lock_enabled: bool
+    is_winding_down: bool
+    worker: str  # The worker's address, or NO_WORKER_BONDED
+
+
+def _read_staker_summary(staker: 'Staker') -> _StakerSummary:
+    checksum_address = staker.checksum_address
+    summary = _StakerSummary(fees=staker.policy_agent.get_fee_amount(checksum_address),
+                             last_committed_period=staker.staking_agent.get_last_committed_period(checksum_address),
+                             missing_commitments=staker.missing_commitments,
+                             min_fee_rate=staker.min_fee_rate,
+                             is_restaking=staker.is_restaking,
+                             restaking_lock_enabled=staker.restaking_lock_enabled,
+                             is_winding_down=staker.is_winding_down,
+                             worker=str(staker.worker_address))
+    return summary
+
 
 def paint_stakes(emitter: StdoutEmitter,
                  stakeholder: 'StakeHolder',
@@ -39,67 +100,59 @@ def paint_stakes(emitter: StdoutEmitter,
     if not stakers:
         emitter.echo("No staking accounts found.")
 
+    # Stakers without stakes are skipped, as well as stakers other than the filter target.
+    # TODO: Something with non-staking accounts?
+    stakers = [staker for staker in stakers
+               if staker.stakes and not (staker_address and staker.checksum_address != staker_address)]
+
+    summaries = read_concurrently(_read_staker_summary, stakers, blockchain=stakeholder.wallet.blockchain)
+
+    # All stakers share the stakeholder's registry
+    network_header = None
+    if stakeholder.registry.source:  # TODO: #1580 - Registry source might be Falsy in tests.
+        network_header = f"\nNetwork {stakeholder.registry.source.network.capitalize()} ".ljust(55, '═')
+
     total_stakers = 0
-    for staker in stakers:
-        if not staker.stakes:
-            # This staker has no active stakes.
-            # TODO: Something with non-staking accounts?
-            continue
-
-        # Filter Target
-        if staker_address and staker.checksum_address != staker_address:
-            continue
-
-        stakes = sorted(staker.stakes, key=lambda s: s.address_index_ordering_key)
-        active_stakes = filter(lambda s: s.is_active, stakes)
-        if not active_stakes:
-            emitter.echo(f"There are no active stakes\n")
-
-        fees = staker.policy_agent.get_fee_amount(staker.checksum_address)
-        pretty_fees = prettify_eth_amount(fees)
-        last_committed = staker.staking_agent.get_last_committed_period(staker.checksum_address)
-        missing = staker.missing_commitments
-        min_fee_rate = prettify_eth_amount(staker.min_fee_rate)
-
-        if missing == -1:
-            missing_info = "Never Made a Commitment (New Stake)"
-        else:
-            missing_info = f'Missing {missing} commitments{"s" if missing > 1 else ""}' if missing else f'Committed #{last_committed}'
-
-        staker_data = [missing_info,
-                       f'{"Yes" if staker.is_restaking else "No"} ({"Locked" if staker.restaking_lock_enabled else "Unlocked"})',
-                       "Yes" if bool(staker.is_winding_down) else "No",
+    for staker, summary in zip(stakers, summaries):
+        lines = list()
+
+        # Stake.is_active reads the current period on-chain, so evaluate it once per stake.
+        stakes = [(stake, stake.is_active) for stake in sorted(staker.stakes, key=lambda s: s.address_index_ordering_key)]
+        rows = [list(stake.describe().values()) for stake, active in stakes if active or paint_inactive]
+        if not any(active for _stake, active in stakes):
+            lines.append("There are no active stakes\n")
+
+        pretty_fees = prettify_eth_amount(summary.fees)
+        missing = summary.missing_commitments
+        min_fee_rate = prettify_eth_amount(summary.min_fee_rate)
+
+        staker_data = [_missing_commitments_info(missing=missing, last_committed=summary.last_committed_period),
+                       f'{"Yes" if summary.is_restaking else "No"} ({"Locked" if summary.restaking_lock_enabled else "Unlocked"})',
+                       "Yes" if summary.is_winding_down else "No",
                        pretty_fees,
                        min_fee_rate]
 
-        line_width = 54
-        if staker.registry.source:  # TODO: #1580 - Registry source might be Falsy in tests.
-            network_snippet = f"\nNetwork {staker.registry.source.network.capitalize()} "
-            snippet_with_line = network_snippet + '═'*(line_width-len(network_snippet)+1)
-            emitter.echo(snippet_with_line, bold=True)
-        emitter.echo(f"Staker {staker.checksum_address} ════", bold=True, color='red' if missing else 'green')
-        emitter.echo(f"Worker {staker.worker_address} ════")
-        emitter.echo(tabulate.tabulate(zip(STAKER_TABLE_COLUMNS, staker_data), floatfmt="fancy_grid"))
-
-        rows = list()
-        for index, stake in enumerate(stakes):
-            if not stake.is_active and not paint_inactive:
-                # This stake is inactive.
-                continue
-            rows.append(list(stake.describe().values()))
+        if network_header:
+            lines.append(emitter.style(network_header, bold=True))
+        lines.append(emitter.style(f"Staker {staker.checksum_address} ════", bold=True, color='red' if missing else 'green'))
+        lines.append(emitter.style(f"Worker {summary.worker} ════"))
+        lines.append(emitter.style(_format_staker_table(staker_data)))
+
         total_stakers += 1
-        emitter.echo(tabulate.tabulate(rows, headers=STAKE_TABLE_COLUMNS, tablefmt="fancy_grid"))  # newline
+        if rows:
+            lines.append(emitter.style(tabulate.tabulate(rows, headers=STAKE_TABLE_COLUMNS, tablefmt="fancy_grid")))
+        emitter.echo('\n'.join(lines))
 
     if not total_stakers:
         emitter.echo("No Stakes found", color='red')
 
 
 def prettify_stake(stake, index: int = None) -> str:
-    start_datetime = stake.start_datetime.local_datetime().strftime("%b %d %H:%M %Z")
-    expiration_datetime = stake.unlock_datetime.local_datetime().strftime("%b %d %H:%M %Z")
+    start_datetime = stake.start_datetime.local_datetime().strftime(_PRETTY_DATETIME_FORMAT)
+    expiration_datetime = stake.unlock_datetime.local_datetime().strftime(_PRETTY_DATETIME_FORMAT)
     duration = stake.duration
 
-    pretty_periods = f'{duration} periods {"." if len(str(duration)) == 2 else ""}'
+    pretty_periods = f'{duration} periods {"." if 10 <= duration < 100 else ""}'
 
     pretty = f'| {index if index is not None else "-"} ' \
              f'| {stake.staker_address[:6]} ' \
@@ -144,22 +197,23 @@ def paint_staged_stake(emitter,
                        start_period,
                        unlock_period,
                        division_message: str = None):
+    seconds_per_period = stakeholder.economics.seconds_per_period
     start_datetime = datetime_at_period(period=start_period,
-                                        seconds_per_period=stakeholder.economics.seconds_per_period,
+                                        seconds_per_period=seconds_per_period,
                                         start_of_period=True)
 
     unlock_datetime = datetime_at_period(period=unlock_period,
-                                         seconds_per_period=stakeholder.economics.seconds_per_period,
+                                         seconds_per_period=seconds_per_period,
                                          start_of_period=True)
 
-    start_datetime_pretty = start_datetime.local_datetime().strftime("%b %d %H:%M %Z")
-    unlock_datetime_pretty = unlock_datetime.local_datetime().strftime("%b %d %H:%M %Z")
+    start_datetime_pretty = start_datetime.local_datetime().strftime(_PRETTY_DATETIME_FORMAT)
+    unlock_datetime_pretty = unlock_datetime.local_datetime().strftime(_PRETTY_DATETIME_FORMAT)
 
     if division_message:
-        emitter.echo(f"\n{'═' * 30} ORIGINAL STAKE {'═' * 28}", bold=True)
+        emitter.echo(f"\n{_SEP30} ORIGINAL STAKE {_SEP28}", bold=True)
         emitter.echo(division_message)
 
-    emitter.echo(f"\n{'═' * 30} STAGED STAKE {'═' * 30}", bold=True)
+    emitter.echo(f"\n{_SEP30} STAGED STAKE {_SEP30}", bold=True)
 
     emitter.echo(f"""
 Staking address: {staking_address}
@@ -172,7 +226,7 @@ Staking address: {staking_address}
 
     # TODO: periods != Days - Do we inform the user here?
 
-    emitter.echo('═'*73, bold=True)
+    emitter.echo(_SEP73, bold=True)
 
 
 def paint_staking_confirmation(emitter, staker, new_stake):
@@ -184,17 +238,20 @@ def paint_staking_confirmation(emitter, staker, new_stake):
 
 
 def paint_staking_accounts(emitter, wallet, registry):
-    from nucypher.blockchain.eth.actors import Staker
+    from nucypher.blockchain.eth.actors import Staker  # Avoid circular import
 
-    rows = list()
-    for account in wallet.accounts:
-        eth = str(Web3.fromWei(wallet.eth_balance(account), 'ether')) + " ETH"
+    def account_row(staker: Staker) -> tuple:
+        account = staker.checksum_address
+        eth = f"{Decimal(wallet.eth_balance(account)) / _ETHER} ETH"
         nu = str(NU.from_nunits(wallet.token_balance(account, registry)))
 
-        staker = Staker(is_me=True, checksum_address=account, registry=registry)
         staker.stakes.refresh()
-        is_staking = 'Yes' if bool(staker.stakes) else 'No'
-        rows.append((is_staking, account, eth, nu))
+        is_staking = 'Yes' if staker.stakes else 'No'
+        return is_staking, account, eth, nu
+
+    # Stakers are built here, since the agency and economics caches they populate are not thread-safe.
+    stakers = [Staker(is_me=True, checksum_address=account, registry=registry) for account in wallet.accounts]
+    rows = read_concurrently(account_row, stakers, blockchain=wallet.blockchain)
     headers = ('Staking', 'Account', 'ETH', 'NU')
     emitter.echo(tabulate.tabulate(rows, showindex=True, headers=headers, tablefmt="fancy_grid"))
 
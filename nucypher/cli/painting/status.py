@@ -16,19 +16,23 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import textwrap
 from collections import Counter
 
 import maya
-from typing import List
+from eth_typing.evm import ChecksumAddress
+from typing import List, NamedTuple, Optional, Tuple
 from web3.main import Web3
+from web3.types import Wei
 
 from nucypher.blockchain.eth.agents import AdjudicatorAgent, ContractAgency, NucypherTokenAgent, PolicyManagerAgent, \
     StakingEscrowAgent
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 from nucypher.blockchain.eth.token import NU
-from nucypher.blockchain.eth.utils import prettify_eth_amount
+from nucypher.blockchain.eth.utils import prettify_eth_amount, read_concurrently
 from nucypher.network.nicknames import nickname_from_seed
+from nucypher.types import NuNits, Period, StakerFlags
 
 
 def paint_contract_status(registry, emitter):
@@ -140,6 +144,49 @@ def paint_locked_tokens_status(emitter, agent, periods) -> None:
                      f"Min: {NU.from_nunits(bucket_min)} - Max: {NU.from_nunits(bucket_max)}")
 
 
+class _StakerStatus(NamedTuple):
+    owned_tokens: NuNits
+    locked_tokens: NuNits
+    last_committed_period: Period
+    worker: ChecksumAddress
+    flags: StakerFlags
+    restaking_lock_enabled: bool
+    restake_unlock_period: Optional[Period]
+    fees: Wei
+    min_fee_rate: Wei
+
+
+def _read_staker_status(staker: str, staking_agent, policy_agent) -> _StakerStatus:
+    flags = staking_agent.get_flags(staker)
+    restaking_lock_enabled = flags.restake_flag and staking_agent.is_restaking_locked(staker)
+    restake_unlock_period = staking_agent.get_restake_unlock_period(staker) if restaking_lock_enabled else None
+    status = _StakerStatus(owned_tokens=staking_agent.owned_tokens(staker),
+                          locked_tokens=staking_agent.get_locked_tokens(staker),
+                          last_committed_period=staking_agent.get_last_committed_period(staker),
+                          worker=staking_agent.get_worker_from_staker(staker),
+                          flags=flags,
+                          restaking_lock_enabled=restaking_lock_enabled,
+                          restake_unlock_period=restake_unlock_period,
+                          fees=policy_agent.get_fee_amount(staker),
+                          min_fee_rate=policy_agent.get_min_fee_rate(staker))
+    return status
+
+
+def _commitment_activity(current_period: Period, last_committed_period: Period) -> Tuple[str, str]:
+    """Describes a staker's commitment activity, returning the message along with the color to paint it with."""
+    if last_committed_period == 0:
+        return "Never made a commitment", 'red'
+
+    missing_commitments = current_period - last_committed_period
+    if missing_commitments == -1:
+        return f"Next period committed (#{last_committed_period})", 'green'
+    if missing_commitments == 0:
+        return (f"Current period committed (#{last_committed_period}). "
+                f"Pending commitment to next period."), 'yellow'
+    return (f"Missing {missing_commitments} commitment{'s' if missing_commitments > 1 else ''} "
+            f"(last time for period #{last_committed_period})"), 'red'
+
+
 def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> None:
     current_period = staking_agent.get_current_period()
     emitter.echo(f"\nCurrent period: {current_period}")
@@ -147,52 +194,45 @@ def paint_stakers(emitter, stakers: List[str], staking_agent, policy_agent) -> N
     emitter.echo(f"{'Checksum address':42}  Staker information")
     emitter.echo('=' * (42 + 2 + 53))
 
-    for staker in stakers:
+    def read_status(staker: str) -> _StakerStatus:
+        return _read_staker_status(staker=staker, staking_agent=staking_agent, policy_agent=policy_agent)
+
+    statuses = read_concurrently(read_status, stakers, blockchain=staking_agent.blockchain)
+    for staker, status in zip(stakers, statuses):
         nickname, pairs = nickname_from_seed(staker)
         symbols = f"{pairs[0][1]}  {pairs[1][1]}"
-        emitter.echo(f"{staker}  {'Nickname:':10} {nickname} {symbols}")
-        tab = " " * len(staker)
-
-        owned_tokens = staking_agent.owned_tokens(staker)
-        last_committed_period = staking_agent.get_last_committed_period(staker)
-        worker = staking_agent.get_worker_from_staker(staker)
-        is_restaking = staking_agent.is_restaking(staker)
-        is_winding_down = staking_agent.is_winding_down(staker)
-
-        missing_commitments = current_period - last_committed_period
-        owned_in_nu = round(NU.from_nunits(owned_tokens), 2)
-        locked_tokens = round(NU.from_nunits(staking_agent.get_locked_tokens(staker)), 2)
-
-        emitter.echo(f"{tab}  {'Owned:':10} {owned_in_nu}  (Staked: {locked_tokens})")
-        if is_restaking:
-            if staking_agent.is_restaking_locked(staker):
-                unlock_period = staking_agent.get_restake_unlock_period(staker)
-                emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Locked until period: {unlock_period})")
-            else:
-                emitter.echo(f"{tab}  {'Re-staking:':10} Yes  (Unlocked)")
-        else:
-            emitter.echo(f"{tab}  {'Re-staking:':10} No")
-        emitter.echo(f"{tab}  {'Winding down:':10} {'Yes' if is_winding_down else 'No'}")
-        emitter.echo(f"{tab}  {'Activity:':10} ", nl=False)
-        if missing_commitments == -1:
-            emitter.echo(f"Next period committed (#{last_committed_period})", color='green')
-        elif missing_commitments == 0:
-            emitter.echo(f"Current period committed (#{last_committed_period}). "
-                         f"Pending commitment to next period.", color='yellow')
-        elif missing_commitments == current_period:
-            emitter.echo(f"Never made a commitment", color='red')
-        else:
-            emitter.echo(f"Missing {missing_commitments} commitments "
-                         f"(last time for period #{last_committed_period})", color='red')
 
-        emitter.echo(f"{tab}  {'Worker:':10} ", nl=False)
-        if worker == NULL_ADDRESS:
-            emitter.echo(f"Worker not bonded", color='red')
+        owned_in_nu = round(NU.from_nunits(status.owned_tokens), 2)
+        locked_tokens = round(NU.from_nunits(status.locked_tokens), 2)
+
+        if status.flags.restake_flag:
+            if status.restaking_lock_enabled:
+                restaking = f"Yes  (Locked until period: {status.restake_unlock_period})"
+            else:
+                restaking = "Yes  (Unlocked)"
         else:
-            emitter.echo(f"{worker}")
+            restaking = "No"
 
-        fees = prettify_eth_amount(policy_agent.get_fee_amount(staker))
-        emitter.echo(f"{tab}  Unclaimed fees: {fees}")
+        activity, activity_color = _commitment_activity(current_period=current_period,
+                                                        last_committed_period=status.last_committed_period)
+        activity = emitter.style(activity, color=activity_color)
 
-        min_rate = prettify_eth_amount(policy_agent.get_min_fee_rate(staker))
-        emitter.echo(f"{tab}  Min fee rate: {min_rate}")
+        if status.worker == NULL_ADDRESS:
+            worker = emitter.style("Worker not bonded", color='red')
+        else:
+            worker = emitter.style(status.worker)
+
+        fees = prettify_eth_amount(status.fees)
+        min_rate = prettify_eth_amount(status.min_fee_rate)
+
+        # Paint each staker with a single write to the output stream,
+        # with the details aligned under the staker's nickname.
+        header = emitter.style(f"{staker}  {'Nickname:':10} {nickname} {symbols}")
+        details = [emitter.style(f"{'Owned:':10} {owned_in_nu}  (Staked: {locked_tokens})"),
+                   emitter.style(f"{'Re-staking:':10} {restaking}"),
+                   emitter.style(f"{'Winding down:':10} {'Yes' if status.flags.wind_down_flag else 'No'}"),
+                   emitter.style(f"{'Activity:':10} ") + activity,
+                   emitter.style(f"{'Worker:':10} ") + worker,
+                   emitter.style(f"Unclaimed fees: {fees}"),
+                   emitter.style(f"Min fee rate: {min_rate}")]
+        emitter.echo(header + '\n' + textwrap.indent('\n'.join(details), " " * (len(staker) + 2)))
@@ -65,5 +65,9 @@ TEMPLATES_DIR = CLI_ROOT / 'templates'
 MAX_UPLOAD_CONTENT_LENGTH = 1024 * 50
 
 
+# CLI
+MAX_CONCURRENT_STAKER_READS = 16  # Upper bound on in-flight staker reads, to stay within the provider's request limits
+
+
 # Dev Mode
 TEMPORARY_DOMAIN = ":TEMPORARY_DOMAIN:"  # for use with `--dev` node runtimes
@@ -92,6 +92,10 @@ def test_nucypher_status_stakers(click_runner, agency_local_registry, stakers):
     assert re.search(r"Worker:\s+" + some_dude.worker_address, result.output, re.MULTILINE)
     assert re.search(r"Owned:\s+" + str(round(owned_tokens, 2)), result.output, re.MULTILINE)
     assert re.search(r"Staked: " + str(round(locked_tokens, 2)), result.output, re.MULTILINE)
+
+    # Stakers in this module haven't made any commitments yet
+    assert staking_agent.get_last_committed_period(staking_address) == 0
+    assert re.search(r"Activity:\s+Never made a commitment", result.output, re.MULTILINE)
     _minimum, default, _maximum = FEE_RATE_RANGE
     assert f"Min fee rate: {default} wei" in result.output
 
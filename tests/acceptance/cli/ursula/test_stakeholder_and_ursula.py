@@ -17,6 +17,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import json
 import random
+import re
 from unittest import mock
 
 import maya
@@ -137,6 +138,19 @@ def test_stake_list(click_runner,
     assert f"{default} wei" in result.output
 
 
+def test_stake_accounts(click_runner,
+                        stakeholder_configuration_file_location,
+                        manual_staker):
+
+    stake_args = ('stake', 'accounts',
+                  '--config-file', stakeholder_configuration_file_location)
+
+    user_input = INSECURE_DEVELOPMENT_PASSWORD
+    result = click_runner.invoke(nucypher_cli, stake_args, input=user_input, catch_exceptions=False)
+    assert result.exit_code == 0
+    assert re.search(f"Yes\\s+│\\s+{manual_staker}", result.output)
+
+
 def test_staker_divide_stakes(click_runner,
                               stakeholder_configuration_file_location,
                               token_economics,
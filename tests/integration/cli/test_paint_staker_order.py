@@ -0,0 +1,109 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.blockchain.eth import utils
+from nucypher.blockchain.eth.actors import StakeHolder
+from nucypher.blockchain.eth.constants import NULL_ADDRESS
+from nucypher.blockchain.eth.token import NU
+from nucypher.cli.painting.staking import paint_stakes, paint_staking_accounts
+from nucypher.cli.painting.status import paint_stakers
+from nucypher.types import StakerFlags
+from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
+
+
+@pytest.fixture(params=[False, True], ids=['serial', 'concurrent'])
+def concurrent_reads(request, monkeypatch):
+    if request.param:
+        # Treat the mock provider as an HTTP provider, so that stakers are read from a thread pool
+        monkeypatch.setattr(utils, 'HTTPProvider', object)
+    return request.param
+
+
+@pytest.fixture()
+def stakeholder(mock_testerchain, mock_staking_agent, test_registry):
+    mock_staking_agent.get_all_stakes.return_value = [(1, 2, 3)]
+    stakeholder = StakeHolder(registry=test_registry)
+    stakeholder.assimilate(checksum_address=mock_testerchain.etherbase_account,
+                           password=INSECURE_DEVELOPMENT_PASSWORD)
+    return stakeholder
+
+
+@pytest.fixture()
+def accounts(stakeholder, mock_policy_manager_agent, mock_token_agent, monkeypatch):
+    accounts = list(stakeholder.wallet.accounts)
+    assert len(accounts) > 1
+
+    # Each account gets its own fees and token balance, so that its row can be told apart
+    def get_fee_amount(staker_address):
+        return accounts.index(staker_address) + 1
+
+    def get_balance(address=None):
+        return accounts.index(address) + 1
+
+    monkeypatch.setattr(mock_policy_manager_agent.get_fee_amount, 'side_effect', get_fee_amount)
+    monkeypatch.setattr(mock_token_agent.get_balance, 'side_effect', get_balance)
+    return accounts
+
+
+def split_by_account(output: str, accounts: list, prefix: str = '') -> list:
+    positions = [output.index(f"{prefix}{account}") for account in accounts]
+    assert positions == sorted(positions), "Accounts are not painted in the wallet's order"
+    return [output[start:end] for start, end in zip(positions, positions[1:] + [len(output)])]
+
+
+def test_paint_stakes_in_account_order(test_emitter, capsys, concurrent_reads, stakeholder, accounts):
+    paint_stakes(emitter=test_emitter, stakeholder=stakeholder)
+
+    captured = capsys.readouterr()
+    for index, painted_staker in enumerate(split_by_account(captured.out, accounts, prefix='Staker ')):
+        assert f"Unclaimed Fees  {index + 1} wei\n" in painted_staker
+
+
+def test_paint_stakers_in_given_order(test_emitter,
+                                      capsys,
+                                      concurrent_reads,
+                                      accounts,
+                                      mock_staking_agent,
+                                      mock_policy_manager_agent,
+                                      monkeypatch):
+    flags = StakerFlags(wind_down_flag=False, restake_flag=False, measure_work_flag=True, snapshot_flag=False)
+    monkeypatch.setattr(mock_staking_agent.get_flags, 'return_value', flags)
+    monkeypatch.setattr(mock_staking_agent.get_worker_from_staker, 'return_value', NULL_ADDRESS)
+
+    paint_stakers(emitter=test_emitter,
+                  stakers=accounts,
+                  staking_agent=mock_staking_agent,
+                  policy_agent=mock_policy_manager_agent)
+
+    captured = capsys.readouterr()
+    for index, painted_staker in enumerate(split_by_account(captured.out, accounts)):
+        assert f"Unclaimed fees: {index + 1} wei\n" in painted_staker
+
+
+def test_paint_staking_accounts_in_wallet_order(test_emitter,
+                                                capsys,
+                                                concurrent_reads,
+                                                stakeholder,
+                                                accounts,
+                                                test_registry):
+    paint_staking_accounts(emitter=test_emitter, wallet=stakeholder.wallet, registry=test_registry)
+
+    captured = capsys.readouterr()
+    for index, painted_row in enumerate(split_by_account(captured.out, accounts)):
+        assert str(NU.from_nunits(index + 1)) in painted_row.splitlines()[0]
@@ -0,0 +1,59 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from nucypher.blockchain.eth.actors import StakeHolder
+from nucypher.cli.painting.staking import STAKE_TABLE_COLUMNS, STAKER_TABLE_COLUMNS, paint_stakes
+from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
+
+
+NO_ACTIVE_STAKES = "There are no active stakes"
+
+
+@pytest.fixture()
+def stakeholder_with_expired_stakes(mock_testerchain, mock_staking_agent, test_registry, monkeypatch):
+    first_period, last_period, value = 1, 2, 3
+    mock_staking_agent.get_all_stakes.return_value = [(first_period, last_period, value)]
+    monkeypatch.setattr(mock_staking_agent.get_current_period, 'return_value', last_period + 1)
+
+    stakeholder = StakeHolder(registry=test_registry)
+    stakeholder.assimilate(checksum_address=mock_testerchain.etherbase_account,
+                           password=INSECURE_DEVELOPMENT_PASSWORD)
+    return stakeholder
+
+
+def test_paint_stakes_without_active_stakes(test_emitter, capsys, stakeholder_with_expired_stakes):
+    paint_stakes(emitter=test_emitter, stakeholder=stakeholder_with_expired_stakes, paint_inactive=False)
+
+    captured = capsys.readouterr()
+    assert NO_ACTIVE_STAKES in captured.out
+    for column_name in STAKER_TABLE_COLUMNS:
+        assert column_name in captured.out
+
+    # There is nothing to show, so the stakes table is not painted at all
+    for column_name in STAKE_TABLE_COLUMNS:
+        assert column_name not in captured.out
+
+
+def test_paint_inactive_stakes(test_emitter, capsys, stakeholder_with_expired_stakes):
+    paint_stakes(emitter=test_emitter, stakeholder=stakeholder_with_expired_stakes, paint_inactive=True)
+
+    captured = capsys.readouterr()
+    assert NO_ACTIVE_STAKES in captured.out
+    for column_name in (*STAKER_TABLE_COLUMNS, *STAKE_TABLE_COLUMNS):
+        assert column_name in captured.out
@@ -0,0 +1,65 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+import tabulate
+
+from nucypher.cli.painting.staking import STAKER_TABLE_COLUMNS, _format_staker_table, _missing_commitments_info
+from nucypher.cli.painting.status import _commitment_activity
+
+
+@pytest.mark.parametrize('staker_data', (
+    ['Committed #5', 'Yes (Unlocked)', 'No', '0.1 ETH', '1 wei'],
+    ['Missing 3 commitments', 'No (Locked)', 'Yes', '0 wei', '100000000 wei'],
+    ['Never Made a Commitment (New Stake)', 'No (Unlocked)', 'No', '0 wei', '0 wei'],
+))
+def test_staker_table_matches_tabulate_layout(staker_data):
+    expected = tabulate.tabulate(zip(STAKER_TABLE_COLUMNS, staker_data))
+    assert _format_staker_table(staker_data) == expected
+
+
+def test_staker_table_rendering():
+    staker_data = ['Committed #5', 'Yes (Unlocked)', 'No', '0.1 ETH', '1 wei']
+    expected = ("--------------  --------------\n"
+                "Status          Committed #5\n"
+                "Restaking       Yes (Unlocked)\n"
+                "Winding Down    No\n"
+                "Unclaimed Fees  0.1 ETH\n"
+                "Min fee rate    1 wei\n"
+                "--------------  --------------")
+    assert _format_staker_table(staker_data) == expected
+
+
+@pytest.mark.parametrize('missing, expected', (
+    (-1, "Never Made a Commitment (New Stake)"),
+    (0, "Committed #42"),
+    (1, "Missing 1 commitment"),
+    (3, "Missing 3 commitments"),
+))
+def test_missing_commitments_info(missing, expected):
+    assert _missing_commitments_info(missing=missing, last_committed=42) == expected
+
+
+@pytest.mark.parametrize('last_committed_period, expected', (
+    (11, ("Next period committed (#11)", 'green')),
+    (10, ("Current period committed (#10). Pending commitment to next period.", 'yellow')),
+    (9, ("Missing 1 commitment (last time for period #9)", 'red')),
+    (7, ("Missing 3 commitments (last time for period #7)", 'red')),
+    (0, ("Never made a commitment", 'red')),
+))
+def test_commitment_activity(last_committed_period, expected):
+    assert _commitment_activity(current_period=10, last_committed_period=last_committed_period) == expected
@@ -0,0 +1,50 @@
+"""
+ This file is part of nucypher.
+
+ nucypher is free software: you can redistribute it and/or modify
+ it under the terms of the GNU Affero General Public License as published by
+ the Free Software Foundation, either version 3 of the License, or
+ (at your option) any later version.
+
+ nucypher is distributed in the hope that it will be useful,
+ but WITHOUT ANY WARRANTY; without even the implied warranty of
+ MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ GNU Affero General Public License for more details.
+
+ You should have received a copy of the GNU Affero General Public License
+ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+
+import pytest
+from web3 import HTTPProvider, IPCProvider, WebsocketProvider
+
+from nucypher.blockchain.eth.utils import read_concurrently
+
+
+class MockBlockchain:
+    def __init__(self, provider):
+        self.provider = provider
+
+
+def test_read_concurrently_over_http_preserves_order():
+    blockchain = MockBlockchain(provider=HTTPProvider(endpoint_uri='http://localhost:8545'))
+    items = list(range(50))
+    assert read_concurrently(lambda item: item * 2, items, blockchain=blockchain) == [item * 2 for item in items]
+
+
+@pytest.mark.parametrize('provider', (
+    WebsocketProvider(endpoint_uri='ws://localhost:8546'),
+    IPCProvider(ipc_path='/tmp/geth.ipc'),
+))
+def test_read_concurrently_reads_serially_over_other_providers(provider):
+    calling_threads = list()
+
+    def read(item):
+        calling_threads.append(threading.current_thread())
+        return item * 2
+
+    items = list(range(5))
+    assert read_concurrently(read, items, blockchain=MockBlockchain(provider=provider)) == [item * 2 for item in items]
+    assert calling_threads == [threading.main_thread()] * len(items)